@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from dotenv import load_dotenv
 from livekit.agents import (
@@ -22,14 +23,17 @@ logger = logging.getLogger("agent")
 
 load_dotenv(".env.local")
 
+# Built once at import so every session shares the same prompt string
+ASSISTANT_INSTRUCTIONS = """You are a helpful voice AI assistant. The user is interacting with you via voice, even if you perceive the conversation as text.
+            You eagerly assist users with their questions by providing information from your extensive knowledge.
+            Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
+            You are curious, friendly, and have a sense of humor."""
+
 
 class Assistant(Agent):
     def __init__(self) -> None:
         super().__init__(
-            instructions="""You are a helpful voice AI assistant. The user is interacting with you via voice, even if you perceive the conversation as text.
-            You eagerly assist users with their questions by providing information from your extensive knowledge.
-            Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
-            You are curious, friendly, and have a sense of humor.""",
+            instructions=ASSISTANT_INSTRUCTIONS,
         )
 
     # To add tools, use the @function_tool decorator.
@@ -50,8 +54,19 @@ class Assistant(Agent):
     #     return "sunny with a temperature of 70 degrees."
 
 
+_VAD_SINGLETON: Optional[silero.VAD] = None
+
+
 def prewarm(proc: JobProcess):
-    proc.userdata["vad"] = silero.VAD.load()
+    # Reuse the loaded model if prewarm runs again in the same process
+    global _VAD_SINGLETON
+    if _VAD_SINGLETON is None:
+        _VAD_SINGLETON = silero.VAD.load(
+            min_speech_duration=0.25,
+            min_silence_duration=0.5,
+            activation_threshold=0.5,
+        )
+    proc.userdata["vad"] = _VAD_SINGLETON
 
 
 async def entrypoint(ctx: JobContext):
@@ -76,6 +91,8 @@ async def entrypoint(ctx: JobContext):
         tts=murf.TTS(
                 voice="en-US-matthew", 
                 style="Conversation",
+                encoding="pcm",
+                sample_rate=24000,
                 tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
                 text_pacing=True
             ),
@@ -109,7 +126,7 @@ async def entrypoint(ctx: JobContext):
 
     async def log_usage():
         summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
+        logger.info("Usage: %s", summary)
 
     ctx.add_shutdown_callback(log_usage)
 